@@ -12,13 +12,19 @@ import yaml
 from pydantic import BaseModel, ValidationError
 
 from .exceptions import ConfigurationError
+from .github_client import GitHubClient, create_github_client
 from .inventory import (
+    OWNED_REPO_HEADERS,
+    STARRED_REPO_HEADERS,
     collect_owned_repositories,
     collect_starred_repositories,
     write_to_csv,
 )
 from .report import generate_markdown_report
 
+YAML_EXTENSIONS = frozenset({".yml", ".yaml"})
+SUPPORTED_CONFIG_EXTENSIONS = YAML_EXTENSIONS | {".json"}
+
 
 class RunConfig(BaseModel):
     """Configuration for a single GitHub account run"""
@@ -65,10 +71,9 @@ def load_config_from_file(config_file: str) -> ConfigsToRun:
 
     # Determine file format based on extension
     file_extension = config_path.suffix.lower()
-    supported_extensions = {".json", ".yml", ".yaml"}
 
-    if file_extension not in supported_extensions:
-        supported_list = ", ".join(sorted(supported_extensions))
+    if file_extension not in SUPPORTED_CONFIG_EXTENSIONS:
+        supported_list = ", ".join(sorted(SUPPORTED_CONFIG_EXTENSIONS))
         raise ValueError(
             f"Unsupported file format '{file_extension}'. "
             f"Supported formats: {supported_list}"
@@ -76,7 +81,7 @@ def load_config_from_file(config_file: str) -> ConfigsToRun:
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            if file_extension in [".yml", ".yaml"]:
+            if file_extension in YAML_EXTENSIONS:
                 try:
                     data = yaml.safe_load(f)
                 except yaml.YAMLError as e:
@@ -127,7 +132,11 @@ def create_output_directory(account: str, base_dir: str = "docs") -> Path:
     return output_dir
 
 
-def process_single_account(config: RunConfig, base_dir: str = "docs") -> bool:
+def process_single_account(
+    config: RunConfig,
+    base_dir: str = "docs",
+    client: Optional[GitHubClient] = None,
+) -> bool:
     """Process a single GitHub account and save to its directory"""
     account = config.account
     limit = config.limit
@@ -153,58 +162,20 @@ def process_single_account(config: RunConfig, base_dir: str = "docs") -> bool:
         # Collect owned repositories
         print(f"\nCollecting owned repositories for: {account}")
         print("-" * 50)
-        owned_repos = collect_owned_repositories(account, limit)
+        owned_repos = collect_owned_repositories(account, limit, client)
 
         if owned_repos:
-            owned_headers = [
-                "name",
-                "description",
-                "url",
-                "visibility",
-                "is_fork",
-                "creation_date",
-                "last_update_date",
-                "default_branch",
-                "number_of_branches",
-                "primary_language",
-                "size",
-            ]
-            write_to_csv(owned_repos, str(owned_csv), owned_headers)
+            write_to_csv(owned_repos, str(owned_csv), OWNED_REPO_HEADERS)
         else:
             print(f"No owned repositories found for {account}")
 
         # Collect starred repositories
         print(f"\nCollecting starred repositories for: {account}")
         print("-" * 50)
-        starred_repos = collect_starred_repositories(account, limit)
+        starred_repos = collect_starred_repositories(account, limit, client)
 
         if starred_repos:
-            starred_headers = [
-                "name",
-                "full_name",
-                "owner",
-                "description",
-                "url",
-                "visibility",
-                "is_fork",
-                "creation_date",
-                "last_update_date",
-                "last_push_date",
-                "default_branch",
-                "number_of_branches",
-                "primary_language",
-                "size",
-                "stars",
-                "forks",
-                "watchers",
-                "open_issues",
-                "license",
-                "topics",
-                "homepage",
-                "archived",
-                "disabled",
-            ]
-            write_to_csv(starred_repos, str(starred_csv), starred_headers)
+            write_to_csv(starred_repos, str(starred_csv), STARRED_REPO_HEADERS)
         else:
             print(f"No starred repositories found for {account}")
 
@@ -239,19 +210,30 @@ def process_single_account(config: RunConfig, base_dir: str = "docs") -> bool:
         return False
 
 
-def run_batch_processing(configs: ConfigsToRun, base_dir: str = "docs") -> None:
-    """Run batch processing for multiple GitHub accounts"""
+def run_batch_processing(
+    configs: ConfigsToRun,
+    base_dir: str = "docs",
+    client: Optional[GitHubClient] = None,
+) -> None:
+    """Run batch processing for multiple GitHub accounts
+
+    A single GitHub client is shared by every account so authentication is
+    checked once per batch rather than once per API call.
+    """
     print("GitHub Repository Inventory - Batch Processing")
     print("=" * 60)
     print(f"Processing {len(configs.configs)} accounts...")
 
+    if client is None:
+        client = create_github_client()
+
     successful = 0
     failed = 0
 
     for i, config in enumerate(configs.configs, 1):
         print(f"\n[{i}/{len(configs.configs)}] Processing: {config.account}")
 
-        success = process_single_account(config, base_dir)
+        success = process_single_account(config, base_dir, client)
         if success:
             successful += 1
         else:
@@ -9,6 +9,7 @@ import os
 import platform
 import subprocess
 import sys
+from collections import Counter
 from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
@@ -22,11 +23,19 @@ from .exceptions import (
 )
 from .github_client import create_github_client
 from .inventory import (
+    OWNED_REPO_HEADERS,
+    STARRED_REPO_HEADERS,
     collect_owned_repositories,
     collect_starred_repositories,
     write_to_csv,
 )
-from .report import generate_markdown_report, read_csv_data
+from .report import count_field_values, generate_markdown_report, read_csv_data
+
+# Command used to open a directory in the file manager, keyed by platform.system()
+FILE_MANAGER_COMMANDS = {
+    "Darwin": "open",  # macOS
+    "Windows": "explorer",
+}
 
 
 class PathManager:
@@ -111,21 +120,8 @@ def collect_repository_data(args, path_manager: PathManager, client=None) -> tup
         owned_repos = collect_owned_repositories(args.user, args.limit, client)
 
         if owned_repos:
-            owned_headers = [
-                "name",
-                "description",
-                "url",
-                "visibility",
-                "is_fork",
-                "creation_date",
-                "last_update_date",
-                "default_branch",
-                "number_of_branches",
-                "primary_language",
-                "size",
-            ]
             owned_csv_path = path_manager.get_owned_csv_path(args.owned_csv)
-            write_to_csv(owned_repos, owned_csv_path, owned_headers)
+            write_to_csv(owned_repos, owned_csv_path, OWNED_REPO_HEADERS)
         else:
             print("Failed to collect owned repositories")
 
@@ -137,33 +133,8 @@ def collect_repository_data(args, path_manager: PathManager, client=None) -> tup
         starred_repos = collect_starred_repositories(args.user, args.limit, client)
 
         if starred_repos:
-            starred_headers = [
-                "name",
-                "full_name",
-                "owner",
-                "description",
-                "url",
-                "visibility",
-                "is_fork",
-                "creation_date",
-                "last_update_date",
-                "last_push_date",
-                "default_branch",
-                "number_of_branches",
-                "primary_language",
-                "size",
-                "stars",
-                "forks",
-                "watchers",
-                "open_issues",
-                "license",
-                "topics",
-                "homepage",
-                "archived",
-                "disabled",
-            ]
             starred_csv_path = path_manager.get_starred_csv_path(args.starred_csv)
-            write_to_csv(starred_repos, starred_csv_path, starred_headers)
+            write_to_csv(starred_repos, starred_csv_path, STARRED_REPO_HEADERS)
         else:
             print("Failed to collect starred repositories")
 
@@ -213,14 +184,10 @@ def open_directory(directory_path):
     if not os.path.exists(abs_path):
         os.makedirs(abs_path, exist_ok=True)
 
-    system = platform.system()
+    # Linux and others fall back to xdg-open
+    opener = FILE_MANAGER_COMMANDS.get(platform.system(), "xdg-open")
     try:
-        if system == "Darwin":  # macOS
-            subprocess.run(["open", abs_path], check=True)  # noqa: S603, S607
-        elif system == "Windows":
-            subprocess.run(["explorer", abs_path], check=True)  # noqa: S603, S607
-        else:  # Linux and others
-            subprocess.run(["xdg-open", abs_path], check=True)  # noqa: S603, S607
+        subprocess.run([opener, abs_path], check=True)  # noqa: S603
         print(f"📂 Opened {abs_path}")
     except subprocess.CalledProcessError:
         print(f"❌ Could not open directory. Path: {abs_path}")
@@ -372,55 +339,43 @@ def print_summary(owned_repos, starred_repos):
 
     if owned_repos:
         print(f"📁 Your repositories: {len(owned_repos)}")
-        public_count = len([r for r in owned_repos if r.get("visibility") == "public"])
-        private_count = len(
-            [r for r in owned_repos if r.get("visibility") == "private"]
-        )
-        fork_count = len([r for r in owned_repos if r.get("is_fork") == "true"])
-        original_count = len([r for r in owned_repos if r.get("is_fork") == "false"])
+        stats = count_field_values(owned_repos, ("visibility", "is_fork"))
+        public_count = stats["visibility", "public"]
+        private_count = stats["visibility", "private"]
+        fork_count = stats["is_fork", "true"]
+        original_count = stats["is_fork", "false"]
 
         print(f"   - Public: {public_count} | Private: {private_count}")
         print(f"   - Original: {original_count} | Forks: {fork_count}")
 
         # Language breakdown
-        languages: Dict[str, int] = {}
-        for repo in owned_repos:
-            lang = repo.get("primary_language", "")
-            if lang:
-                languages[lang] = languages.get(lang, 0) + 1
+        languages = Counter(
+            lang for repo in owned_repos if (lang := repo.get("primary_language", ""))
+        )
 
         if languages:
-            top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[
-                :3
-            ]
+            top_languages = languages.most_common(3)
             lang_str = " | ".join([f"{lang}: {count}" for lang, count in top_languages])
             print(f"   - Top languages: {lang_str}")
 
     if starred_repos:
         print(f"⭐ Starred repositories: {len(starred_repos)}")
-        public_count = len(
-            [r for r in starred_repos if r.get("visibility") == "public"]
-        )
-        private_count = len(
-            [r for r in starred_repos if r.get("visibility") == "private"]
-        )
-        archived_count = len([r for r in starred_repos if r.get("archived") == "true"])
+        stats = count_field_values(starred_repos, ("visibility", "archived"))
+        public_count = stats["visibility", "public"]
+        private_count = stats["visibility", "private"]
+        archived_count = stats["archived", "true"]
 
         print(
             f"   - Public: {public_count} | Private: {private_count} | Archived: {archived_count}"
         )
 
         # Language breakdown
-        starred_languages: Dict[str, int] = {}
-        for repo in starred_repos:
-            lang = repo.get("primary_language", "")
-            if lang:
-                starred_languages[lang] = starred_languages.get(lang, 0) + 1
+        starred_languages = Counter(
+            lang for repo in starred_repos if (lang := repo.get("primary_language", ""))
+        )
 
         if starred_languages:
-            top_languages = sorted(
-                starred_languages.items(), key=lambda x: x[1], reverse=True
-            )[:3]
+            top_languages = starred_languages.most_common(3)
             lang_str = " | ".join([f"{lang}: {count}" for lang, count in top_languages])
             print(f"   - Top languages: {lang_str}")
 
@@ -498,7 +453,7 @@ def main():
     # Create GitHub client
     try:
         client = create_github_client(args.client_type, args.github_token)
-    except (ValueError, AuthenticationError) as e:
+    except (ValueError, AuthenticationError, GitHubCLIError) as e:
         print(f"❌ Client setup error: {e}")
         if args.client_type == "api" and not args.github_token:
             print(
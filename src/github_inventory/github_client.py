@@ -14,6 +14,9 @@ from typing import Dict, List, Optional, Union
 
 from .exceptions import AuthenticationError, GitHubCLIError
 
+# Substrings in gh stderr output that indicate missing or expired authentication
+AUTH_ERROR_MARKERS = ("authentication", "login")
+
 
 class GitHubClient(ABC):
     """Abstract base class for GitHub API clients"""
@@ -56,7 +59,8 @@ class CLIGitHubClient(GitHubClient):
             stderr = e.stderr.strip() if e.stderr else ""
 
             # Check for common authentication errors
-            if "authentication" in stderr.lower() or "login" in stderr.lower():
+            stderr_lower = stderr.lower()
+            if any(marker in stderr_lower for marker in AUTH_ERROR_MARKERS):
                 raise AuthenticationError(
                     "GitHub CLI authentication required. Please run 'gh auth login'"
                 ) from e
@@ -119,9 +123,9 @@ class APIGitHubClient(GitHubClient):
                 return self.api_request(f"users/{username}/repos")
         elif cmd_str.startswith("gh api"):
             # Direct API call
-            endpoint = cmd_str.split("gh api", 1)[1].strip()
+            endpoint = cmd_str.partition("gh api")[2].strip()
             # Remove any flags for simplicity
-            endpoint = endpoint.split(" --")[0]
+            endpoint = endpoint.partition(" --")[0]
             return self.api_request(endpoint)
 
         raise NotImplementedError(f"Command translation not implemented: {cmd_str}")
@@ -211,6 +215,7 @@ def create_github_client(
     Raises:
         ValueError: When invalid client type or missing token
         AuthenticationError: When CLI authentication is not available
+        GitHubCLIError: When the GitHub CLI cannot be run (e.g. not installed)
     """
     if client_type == "cli":
         client = CLIGitHubClient()
@@ -221,6 +226,10 @@ def create_github_client(
             raise AuthenticationError(
                 "GitHub CLI not authenticated. Please run 'gh auth login'"
             ) from e
+        except OSError as e:
+            raise GitHubCLIError(
+                "gh auth status", f"Could not run GitHub CLI: {e}"
+            ) from e
         return client
     elif client_type == "api":
         if not github_token:
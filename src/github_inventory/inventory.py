@@ -6,6 +6,7 @@ Uses GitHub CLI to gather comprehensive repository information
 
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -15,6 +16,51 @@ from .exceptions import (
 )
 from .github_client import GitHubClient, create_github_client
 
+# Branch counts need one API call per repository; these calls are I/O-bound,
+# so a small pool overlaps them without flooding the GitHub API
+BRANCH_COUNT_WORKERS = 8
+
+# CSV column order for owned and starred repository exports
+OWNED_REPO_HEADERS = [
+    "name",
+    "description",
+    "url",
+    "visibility",
+    "is_fork",
+    "creation_date",
+    "last_update_date",
+    "default_branch",
+    "number_of_branches",
+    "primary_language",
+    "size",
+]
+
+STARRED_REPO_HEADERS = [
+    "name",
+    "full_name",
+    "owner",
+    "description",
+    "url",
+    "visibility",
+    "is_fork",
+    "creation_date",
+    "last_update_date",
+    "last_push_date",
+    "default_branch",
+    "number_of_branches",
+    "primary_language",
+    "size",
+    "stars",
+    "forks",
+    "watchers",
+    "open_issues",
+    "license",
+    "topics",
+    "homepage",
+    "archived",
+    "disabled",
+]
+
 
 def run_gh_command(cmd, client: Optional[GitHubClient] = None):
     """Run a GitHub CLI command and return the result
@@ -95,6 +141,31 @@ def get_branch_count(owner, repo_name, client: Optional[GitHubClient] = None):
         return "unknown"
 
 
+def iter_branch_counts(repo_refs, client: Optional[GitHubClient] = None):
+    """Fetch branch counts for several repositories concurrently
+
+    Args:
+        repo_refs: List of (owner, repo_name) tuples
+        client: GitHub client to use (creates default if None)
+
+    Yields:
+        int or str: Branch count for each repository, in input order
+    """
+    # Resolve the client once so worker threads don't each re-check auth
+    if client is None:
+        client = create_github_client()
+
+    with ThreadPoolExecutor(max_workers=BRANCH_COUNT_WORKERS) as executor:
+        yield from executor.map(
+            lambda ref: get_branch_count(ref[0], ref[1], client), repo_refs
+        )
+
+
+def format_flag(value):
+    """Format a boolean flag as the lowercase string stored in CSV output"""
+    return "true" if value else "false"
+
+
 def format_date(date_str):
     """Format ISO date string to readable format"""
     if not date_str:
@@ -117,34 +188,28 @@ def collect_owned_repositories(
         return []
 
     detailed_repos = []
+    branch_counts = iter_branch_counts(
+        [(username, repo["name"]) for repo in repos], client
+    )
 
-    for i, repo in enumerate(repos, 1):
+    for i, (repo, branch_count) in enumerate(zip(repos, branch_counts, strict=True), 1):
         print(f"Processing repository {i}/{len(repos)}: {repo['name']}")
 
-        # Get branch count
-        branch_count = get_branch_count(username, repo["name"], client)
-
         # Extract and format data
         repo_data = {
             "name": repo.get("name", ""),
             "description": repo.get("description", ""),
             "url": repo.get("url", ""),
             "visibility": "private" if repo.get("isPrivate", False) else "public",
-            "is_fork": str(repo.get("isFork", False)).lower(),
+            "is_fork": format_flag(repo.get("isFork", False)),
             "creation_date": format_date(repo.get("createdAt", "")),
             "last_update_date": format_date(repo.get("updatedAt", "")),
-            "default_branch": (
-                repo.get("defaultBranchRef", {}).get("name", "")
-                if repo.get("defaultBranchRef")
-                else ""
-            ),
+            "default_branch": (repo.get("defaultBranchRef") or {}).get("name", ""),
             "number_of_branches": str(branch_count),
-            "primary_language": (
-                repo.get("primaryLanguage", {}).get("name", "")
-                if repo.get("primaryLanguage")
-                else ""
+            "primary_language": (repo.get("primaryLanguage") or {}).get("name", ""),
+            "size": (
+                str(repo["diskUsage"]) if repo.get("diskUsage") is not None else ""
             ),
-            "size": str(repo.get("diskUsage", "")) if repo.get("diskUsage") else "",
         }
 
         detailed_repos.append(repo_data)
@@ -189,7 +254,7 @@ def get_starred_repos(username=None, limit=None, client: Optional[GitHubClient]
     try:
         # The paginated output might be multiple JSON arrays, so we need to parse each line
         starred_repos = []
-        for line in output.strip().split("\n"):
+        for line in output.split("\n"):
             if line.strip():
                 repos_batch = json.loads(line)
                 if isinstance(repos_batch, list):
@@ -216,26 +281,23 @@ def collect_starred_repositories(
         return []
 
     detailed_repos = []
+    branch_counts = iter_branch_counts(
+        [((repo.get("owner") or {}).get("login", ""), repo["name"]) for repo in repos],
+        client,
+    )
 
-    for i, repo in enumerate(repos, 1):
+    for i, (repo, branch_count) in enumerate(zip(repos, branch_counts, strict=True), 1):
         print(f"Processing starred repository {i}/{len(repos)}: {repo['full_name']}")
 
-        # Get branch count
-        branch_count = get_branch_count(
-            repo.get("owner", {}).get("login", ""), repo["name"], client
-        )
-
         # Extract and format data
         repo_data = {
             "name": repo.get("name", ""),
             "full_name": repo.get("full_name", ""),
-            "owner": (
-                repo.get("owner", {}).get("login", "") if repo.get("owner") else ""
-            ),
+            "owner": (repo.get("owner") or {}).get("login", ""),
             "description": repo.get("description", ""),
             "url": repo.get("html_url", ""),
             "visibility": "private" if repo.get("private", False) else "public",
-            "is_fork": str(repo.get("fork", False)).lower(),
+            "is_fork": format_flag(repo.get("fork", False)),
             "creation_date": format_date(repo.get("created_at", "")),
             "last_update_date": format_date(repo.get("updated_at", "")),
             "last_push_date": format_date(repo.get("pushed_at", "")),
@@ -247,13 +309,11 @@ def collect_starred_repositories(
             "forks": str(repo.get("forks_count", 0)),
             "watchers": str(repo.get("watchers_count", 0)),
             "open_issues": str(repo.get("open_issues_count", 0)),
-            "license": (
-                repo.get("license", {}).get("name", "") if repo.get("license") else ""
-            ),
-            "topics": ", ".join(repo.get("topics", [])) if repo.get("topics") else "",
+            "license": (repo.get("license") or {}).get("name", ""),
+            "topics": ", ".join(repo.get("topics") or []),
             "homepage": repo.get("homepage", ""),
-            "archived": str(repo.get("archived", False)).lower(),
-            "disabled": str(repo.get("disabled", False)).lower(),
+            "archived": format_flag(repo.get("archived", False)),
+            "disabled": format_flag(repo.get("disabled", False)),
         }
 
         detailed_repos.append(repo_data)
@@ -5,22 +5,29 @@ Creates a markdown file with tables showing repository inventories
 """
 
 import csv
+import functools
 import os
+from collections import Counter
 from datetime import datetime
 
 from dotenv import load_dotenv
 
 
+@functools.cache
+def _load_dotenv_once():
+    """Load .env settings on first use; later report tables reuse them"""
+    load_dotenv()
+
+
 def read_csv_data(filename):
     """Read CSV data and return as list of dictionaries"""
-    if not os.path.exists(filename):
-        print(f"Error: {filename} not found")
-        return []
-
     try:
         with open(filename, "r", encoding="utf-8") as file:
             reader = csv.DictReader(file)
             return list(reader)
+    except FileNotFoundError:
+        print(f"Error: {filename} not found")
+        return []
     except Exception as e:
         print(f"Error reading {filename}: {e}")
         return []
@@ -51,6 +58,11 @@ def format_size_mb(value):
         return value
 
 
+def count_field_values(repos, fields):
+    """Count (field, value) pairs across repositories in a single pass"""
+    return Counter((field, repo.get(field)) for repo in repos for field in fields)
+
+
 def truncate_description(description, max_length=80):
     """Truncate description to fit in table"""
     if not description or len(description) <= max_length:
@@ -64,7 +76,7 @@ def create_owned_repos_table(repos_data, limit_applied=None):
         return "No owned repository data found.\n\n"
 
     # Load environment variables
-    load_dotenv()
+    _load_dotenv_once()
 
     # Get display limit from environment variable, default to 30
     display_limit = int(os.getenv("REPORT_OWNED_LIMIT", "30"))
@@ -80,23 +92,22 @@ def create_owned_repos_table(repos_data, limit_applied=None):
     table += f"**Total:** {len(repos_data)} repositories\n\n"
 
     # Summary stats
-    public_count = len([r for r in repos_data if r.get("visibility") == "public"])
-    private_count = len([r for r in repos_data if r.get("visibility") == "private"])
-    fork_count = len([r for r in repos_data if r.get("is_fork") == "true"])
-    original_count = len([r for r in repos_data if r.get("is_fork") == "false"])
+    stats = count_field_values(repos_data, ("visibility", "is_fork"))
+    public_count = stats["visibility", "public"]
+    private_count = stats["visibility", "private"]
+    fork_count = stats["is_fork", "true"]
+    original_count = stats["is_fork", "false"]
 
     table += f"- **Public:** {public_count} | **Private:** {private_count}\n"
     table += f"- **Original:** {original_count} | **Forks:** {fork_count}\n\n"
 
     # Language breakdown
-    languages: dict[str, int] = {}
-    for repo in repos_data:
-        lang = repo.get("primary_language", "")
-        if lang:
-            languages[lang] = languages.get(lang, 0) + 1
+    languages = Counter(
+        lang for repo in repos_data if (lang := repo.get("primary_language", ""))
+    )
 
     if languages:
-        top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:5]
+        top_languages = languages.most_common(5)
         table += (
             "**Top Languages:** "
             + " | ".join([f"{lang}: {count}" for lang, count in top_languages])
@@ -139,7 +150,7 @@ def create_starred_repos_table(starred_data, limit_applied=None):
         return "No starred repository data found.\n\n"
 
     # Load environment variables
-    load_dotenv()
+    _load_dotenv_once()
 
     # Get display limit from environment variable, default to 25
     display_limit = int(os.getenv("REPORT_STARRED_LIMIT", "25"))
@@ -155,21 +166,20 @@ def create_starred_repos_table(starred_data, limit_applied=None):
     table += f"**Total:** {len(starred_data)} starred repositories\n\n"
 
     # Summary stats
-    public_count = len([r for r in starred_data if r.get("visibility") == "public"])
-    private_count = len([r for r in starred_data if r.get("visibility") == "private"])
-    archived_count = len([r for r in starred_data if r.get("archived") == "true"])
+    stats = count_field_values(starred_data, ("visibility", "archived"))
+    public_count = stats["visibility", "public"]
+    private_count = stats["visibility", "private"]
+    archived_count = stats["archived", "true"]
 
     table += f"- **Public:** {public_count} | **Private:** {private_count} | **Archived:** {archived_count}\n\n"
 
     # Language breakdown
-    languages: dict[str, int] = {}
-    for repo in starred_data:
-        lang = repo.get("primary_language", "")
-        if lang:
-            languages[lang] = languages.get(lang, 0) + 1
+    languages = Counter(
+        lang for repo in starred_data if (lang := repo.get("primary_language", ""))
+    )
 
     if languages:
-        top_languages = sorted(languages.items(), key=lambda x: x[1], reverse=True)[:8]
+        top_languages = languages.most_common(8)
         table += (
             "**Top Languages:** "
             + " | ".join([f"{lang}: {count}" for lang, count in top_languages])
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Tests for batch processing module
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from github_inventory.batch import ConfigsToRun, RunConfig, run_batch_processing
+from github_inventory.exceptions import GitHubCLIError
+from github_inventory.github_client import MockGitHubClient
+
+
+class TestBatchProcessing:
+    """Test batch processing across accounts"""
+
+    @patch("github_inventory.batch.create_github_client")
+    @patch("github_inventory.batch.collect_starred_repositories")
+    @patch("github_inventory.batch.collect_owned_repositories")
+    def test_run_batch_processing_shares_client(
+        self, mock_collect_owned, mock_collect_starred, mock_create_client, tmp_path
+    ):
+        """Test every account uses the client passed to run_batch_processing"""
+        mock_collect_owned.return_value = [{"name": "repo1"}]
+        mock_collect_starred.return_value = [{"name": "starred1"}]
+        configs = ConfigsToRun(
+            configs=[RunConfig(account="alice"), RunConfig(account="bob", limit=5)]
+        )
+        client = MockGitHubClient()
+
+        run_batch_processing(configs, base_dir=str(tmp_path), client=client)
+
+        mock_create_client.assert_not_called()
+        assert mock_collect_owned.call_count == 2
+        assert mock_collect_starred.call_count == 2
+        for call in (
+            mock_collect_owned.call_args_list + mock_collect_starred.call_args_list
+        ):
+            assert call.args[2] is client
+        assert (tmp_path / "alice" / "README.md").exists()
+        assert (tmp_path / "bob" / "repos.csv").exists()
+
+    @patch(
+        "github_inventory.batch.create_github_client",
+        side_effect=GitHubCLIError("gh auth status", "Could not run GitHub CLI"),
+    )
+    def test_run_batch_processing_client_setup_error(self, mock_create_client):
+        """Test client setup failures surface as GitHubInventoryError"""
+        configs = ConfigsToRun(configs=[RunConfig(account="alice")])
+
+        with pytest.raises(GitHubCLIError):
+            run_batch_processing(configs)
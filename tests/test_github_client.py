@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Tests for github_client module
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from github_inventory.exceptions import GitHubCLIError
+from github_inventory.github_client import APIGitHubClient, create_github_client
+
+
+class TestAPIGitHubClientTranslation:
+    """Test translation of gh CLI commands to API requests"""
+
+    @patch.object(APIGitHubClient, "api_request", return_value="[]")
+    def test_gh_api_command_strips_flags(self, mock_api_request):
+        """Test gh api commands are translated to their bare endpoint"""
+        client = APIGitHubClient("token")
+
+        client.run_command('gh api repos/owner/repo/branches --jq "length"')
+
+        mock_api_request.assert_called_once_with("repos/owner/repo/branches")
+
+    @patch.object(APIGitHubClient, "api_request", return_value="[]")
+    def test_gh_repo_list_command(self, mock_api_request):
+        """Test gh repo list is translated to the user repos endpoint"""
+        client = APIGitHubClient("token")
+
+        client.run_command("gh repo list octocat --limit 10")
+
+        mock_api_request.assert_called_once_with("users/octocat/repos")
+
+    def test_unsupported_command(self):
+        """Test untranslatable commands raise NotImplementedError"""
+        client = APIGitHubClient("token")
+
+        with pytest.raises(NotImplementedError):
+            client.run_command("gh auth status")
+
+
+class TestCreateGitHubClient:
+    """Test GitHub client factory"""
+
+    @patch("subprocess.run", side_effect=FileNotFoundError("gh"))
+    def test_cli_client_missing_gh_binary(self, mock_run):
+        """Test a missing gh binary surfaces as GitHubCLIError"""
+        with pytest.raises(GitHubCLIError) as exc_info:
+            create_github_client("cli")
+
+        assert "Could not run GitHub CLI" in str(exc_info.value)
@@ -6,6 +6,7 @@ Tests for inventory module
 import csv
 import json
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
@@ -13,8 +14,11 @@ from github_inventory.github_client import MockGitHubClient
 from github_inventory.inventory import (
     collect_owned_repositories,
     format_date,
+    format_flag,
     get_branch_count,
     get_repo_list,
+    get_starred_repos,
+    iter_branch_counts,
     run_gh_command,
     write_to_csv,
 )
@@ -57,6 +61,32 @@ class TestGitHubCLICommands:
 
         assert result == []
 
+    def test_get_starred_repos_paginated_output(self):
+        """Test parsing one JSON array per page from paginated output"""
+        page1 = json.dumps([{"name": "repo1"}, {"name": "repo2"}])
+        page2 = json.dumps([{"name": "repo3"}])
+        client = MockGitHubClient()
+        client.set_response("gh api user/starred", f"{page1}\n\n{page2}\n")
+
+        result = get_starred_repos(client=client)
+
+        assert [repo["name"] for repo in result] == ["repo1", "repo2", "repo3"]
+
+    @pytest.mark.parametrize("separator", ["\u2028", "\u2029", "\x85"])
+    def test_get_starred_repos_unicode_line_separator_in_string(self, separator):
+        """Test Unicode line separators inside JSON strings do not split a page"""
+        description = f"first{separator}second"
+        page = json.dumps(
+            [{"name": "repo1", "description": description}], ensure_ascii=False
+        )
+        client = MockGitHubClient()
+        client.set_response("gh api user/starred", f"{page}\n")
+
+        result = get_starred_repos(client=client)
+
+        assert len(result) == 1
+        assert result[0]["description"] == description
+
     def test_get_branch_count_success(self):
         """Test successful branch count retrieval"""
         client = MockGitHubClient()
@@ -75,6 +105,32 @@ class TestGitHubCLICommands:
 
         assert result == "unknown"
 
+    def test_iter_branch_counts_preserves_order(self):
+        """Test concurrent branch counts are returned in input order"""
+        client = MockGitHubClient()
+        for i in range(20):
+            client.set_response(f"gh api repos/owner/repo{i}/branches", str(i))
+
+        refs = [("owner", f"repo{i}") for i in range(20)]
+        result = list(iter_branch_counts(refs, client))
+
+        assert result == list(range(20))
+        assert len(client.call_history) == 20
+
+    @patch("github_inventory.inventory.create_github_client")
+    def test_iter_branch_counts_creates_default_client_once(self, mock_create):
+        """Test a missing client is created once, not once per repository"""
+        client = MockGitHubClient()
+        client.set_response("gh api repos/owner/", "4")
+        mock_create.return_value = client
+
+        refs = [("owner", f"repo{i}") for i in range(10)]
+        result = list(iter_branch_counts(refs))
+
+        assert result == [4] * 10
+        mock_create.assert_called_once_with()
+        assert len(client.call_history) == 10
+
 
 class TestDataFormatting:
     """Test data formatting functions"""
@@ -99,6 +155,12 @@ class TestDataFormatting:
         result = format_date("invalid-date")
         assert result == "invalid-date"
 
+    def test_format_flag(self):
+        """Test formatting boolean flags"""
+        assert format_flag(True) == "true"
+        assert format_flag(False) == "false"
+        assert format_flag(None) == "false"
+
 
 class TestRepositoryCollection:
     """Test repository data collection"""
@@ -135,6 +197,31 @@ class TestRepositoryCollection:
         assert repo["number_of_branches"] == "3"
         assert repo["primary_language"] == "Python"
 
+    def test_collect_owned_repositories_zero_disk_usage(self):
+        """Test an empty repository reports size 0 rather than blank"""
+        mock_repos = [{"name": "empty-repo", "diskUsage": 0}]
+
+        client = MockGitHubClient()
+        client.set_response("gh repo list", json.dumps(mock_repos))
+
+        result = collect_owned_repositories("testuser", client=client)
+
+        assert result[0]["size"] == "0"
+
+    def test_collect_owned_repositories_null_nested_fields(self):
+        """Test null nested objects from the API are written as blanks"""
+        mock_repos = [
+            {"name": "bare-repo", "defaultBranchRef": None, "primaryLanguage": None}
+        ]
+
+        client = MockGitHubClient()
+        client.set_response("gh repo list", json.dumps(mock_repos))
+
+        result = collect_owned_repositories("testuser", client=client)
+
+        assert result[0]["default_branch"] == ""
+        assert result[0]["primary_language"] == ""
+
     def test_collect_owned_repositories_empty(self):
         """Test collecting owned repositories when none exist"""
         client = MockGitHubClient()
@@ -83,10 +83,11 @@ class TestLimitParameter:
         assert "users/testuser/starred" in called_cmd
         assert "--paginate" in called_cmd
 
+    @patch("github_inventory.inventory.create_github_client")
     @patch("github_inventory.inventory.get_branch_count")
     @patch("github_inventory.inventory.get_repo_list")
     def test_collect_owned_repositories_with_limit(
-        self, mock_get_repos, mock_get_branches
+        self, mock_get_repos, mock_get_branches, mock_create_client
     ):
         """Test that collect_owned_repositories passes limit correctly"""
         mock_repos = [
@@ -116,10 +117,11 @@ class TestLimitParameter:
         collect_owned_repositories("testuser")
         mock_get_repos.assert_called_once_with("testuser", None, None)
 
+    @patch("github_inventory.inventory.create_github_client")
     @patch("github_inventory.inventory.get_branch_count")
     @patch("github_inventory.inventory.get_starred_repos")
     def test_collect_starred_repositories_with_limit(
-        self, mock_get_starred, mock_get_branches
+        self, mock_get_starred, mock_get_branches, mock_create_client
     ):
         """Test that collect_starred_repositories passes limit correctly"""
         mock_repos = [
@@ -10,6 +10,7 @@ from unittest.mock import patch
 import pytest
 
 from github_inventory.report import (
+    count_field_values,
     create_owned_repos_table,
     create_starred_repos_table,
     create_summary_section,
@@ -50,9 +51,8 @@ class TestCSVReading:
     @patch("builtins.open", side_effect=Exception("Read error"))
     def test_read_csv_data_read_error(self, mock_file):
         """Test CSV reading with file read error"""
-        with patch("os.path.exists", return_value=True):
-            result = read_csv_data("error_file.csv")
-            assert result == []
+        result = read_csv_data("error_file.csv")
+        assert result == []
 
 
 class TestDataFormatting:
@@ -73,6 +73,22 @@ class TestDataFormatting:
         """Test formatting invalid number"""
         assert format_number("not-a-number") == "not-a-number"
 
+    def test_count_field_values(self):
+        """Test tallying field values across repositories"""
+        repos = [
+            {"visibility": "public", "is_fork": "true"},
+            {"visibility": "public", "is_fork": "false"},
+            {"visibility": "private", "is_fork": "false"},
+        ]
+
+        stats = count_field_values(repos, ("visibility", "is_fork"))
+
+        assert stats["visibility", "public"] == 2
+        assert stats["visibility", "private"] == 1
+        assert stats["is_fork", "true"] == 1
+        assert stats["is_fork", "false"] == 2
+        assert stats["archived", "true"] == 0
+
     def test_truncate_description_short(self):
         """Test truncating short description"""
         short_desc = "Short description"